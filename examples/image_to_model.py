@@ -3,13 +3,9 @@
 Example of using the Tripo API to create a 3D model from an image.
 """
 
-import os
 import asyncio
 import argparse
 
-from tripo3d import TripoClient
-from tripo3d.models import TaskStatus
-
 
 async def main(image_path: str, output_dir: str):
     """
@@ -19,35 +15,19 @@ async def main(image_path: str, output_dir: str):
         image_path: Path to the input image file.
         output_dir: Directory to save output files.
     """
-    async with TripoClient() as client:
-        # Create task
+    # Import here so `--help` and argument errors never load the HTTP stack
+    from tripo3d import get_shared_client, close_shared_client
+    from tripo3d.cli import run_and_download
+
+    # Reuse the shared client so all requests go over one connection pool
+    client = await get_shared_client()
+    try:
         task_id = await client.image_to_model(
             image=image_path,
         )
-
-        # Wait for task completion and show progress
-        task = await client.wait_for_task(task_id, verbose=True)
-
-        if task.status == TaskStatus.SUCCESS:
-            print(f"Task completed successfully!")
-
-            # Create output directory (if it doesn't exist)
-            os.makedirs(output_dir, exist_ok=True)
-
-            # Download model files
-            try:
-                print("Downloading model files...")
-                downloaded_files = await client.download_task_models(task, output_dir)
-
-                # Print downloaded file paths
-                for model_type, file_path in downloaded_files.items():
-                    if file_path:
-                        print(f"Downloaded {model_type}: {file_path}")
-
-            except Exception as e:
-                print(f"Failed to download models: {str(e)}")
-        else:
-            print(f"Task failed with status: {task.status}")
+        await run_and_download(client, task_id, output_dir)
+    finally:
+        await close_shared_client()
 
 
 if __name__ == "__main__":
@@ -58,5 +38,12 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
+    # Use uvloop's faster event loop when available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Run the main function
-    asyncio.run(main(args.image_path, args.output_dir)) 
\ No newline at end of file
+    asyncio.run(main(args.image_path, args.output_dir))
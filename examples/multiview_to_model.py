@@ -3,14 +3,10 @@
 Example of using the Tripo API to create a 3D model from multiple view images.
 """
 
-import os
 import asyncio
 import argparse
 from typing import Optional
 
-from tripo3d import TripoClient
-from tripo3d.models import TaskStatus
-
 
 async def main(front: Optional[str], back: Optional[str], left: Optional[str], right: Optional[str], output_dir: str):
     """
@@ -23,43 +19,23 @@ async def main(front: Optional[str], back: Optional[str], left: Optional[str], r
         right: Path to the right view image (optional).
         output_dir: Directory to save output files.
     """
-    # Prepare image list, maintain order: front, back, left, right
-    images = [left, back, right]
+    # Import here so `--help` and argument errors never load the HTTP stack
+    from tripo3d import get_shared_client, close_shared_client
+    from tripo3d.cli import run_and_download
 
-    # Check if at least one image is provided
-    if not any(images):
-        raise ValueError("At least one image must be provided")
+    # Prepare images in one shot, maintain order: front, left, back, right.
+    # The CLI boundary below already validates that at least one is provided.
+    images = (front, left, back, right)
 
-    images.insert(0, front)
-    async with TripoClient() as client:
-        # Create task
+    # Reuse the shared client so all requests go over one connection pool
+    client = await get_shared_client()
+    try:
         task_id = await client.multiview_to_model(
             images=images,
         )
-
-        # Wait for task completion and show progress
-        task = await client.wait_for_task(task_id, verbose=True)
-
-        if task.status == TaskStatus.SUCCESS:
-            print(f"Task completed successfully!")
-
-            # Create output directory (if it doesn't exist)
-            os.makedirs(output_dir, exist_ok=True)
-
-            # Download model files
-            try:
-                print("Downloading model files...")
-                downloaded_files = await client.download_task_models(task, output_dir)
-
-                # Print downloaded file paths
-                for model_type, file_path in downloaded_files.items():
-                    if file_path:
-                        print(f"Downloaded {model_type}: {file_path}")
-
-            except Exception as e:
-                print(f"Failed to download models: {str(e)}")
-        else:
-            print(f"Task failed with status: {task.status}")
+        await run_and_download(client, task_id, output_dir)
+    finally:
+        await close_shared_client()
 
 
 if __name__ == "__main__":
@@ -80,6 +56,13 @@ if __name__ == "__main__":
     if not any([args.front, args.back, args.left, args.right]):
         parser.error("At least one view image must be provided")
 
+    # Use uvloop's faster event loop when available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Run the main function
     asyncio.run(main(
         front=args.front,
@@ -87,4 +70,4 @@ if __name__ == "__main__":
         left=args.left,
         right=args.right,
         output_dir=args.output_dir
-    )) 
\ No newline at end of file
+    ))
@@ -3,12 +3,16 @@
 Example of using the Tripo API to apply animations to a rigged 3D model.
 """
 
-import os
 import asyncio
 import argparse
 
-from tripo3d import TripoClient
-from tripo3d.models import TaskStatus, Animation
+from tripo3d.models import Animation
+
+# O(1) lookup table; Animation(value) does a linear scan per call
+_ANIM_BY_VALUE = {anim.value: anim for anim in Animation}
+
+# The set of valid animation names is constant per process, so compute it once
+AVAILABLE_ANIMATIONS = tuple(_ANIM_BY_VALUE)
 
 
 async def main(rigged_model_task_id: str, output_dir: str, animations: list, out_format: str, bake_animation: bool, export_with_geometry: bool):
@@ -23,18 +27,24 @@ async def main(rigged_model_task_id: str, output_dir: str, animations: list, out
         bake_animation: Whether to bake the animation.
         export_with_geometry: Whether to export with geometry.
     """
-    async with TripoClient() as client:
+    # Import here so `--help` and argument errors never load the HTTP stack
+    from tripo3d import get_shared_client, close_shared_client
+    from tripo3d.cli import run_and_download
+
+    # Reuse the shared client so all requests go over one connection pool
+    client = await get_shared_client()
+    try:
         # Apply animations to the rigged model
         print(f"Applying animations {animations} to model {rigged_model_task_id}...")
 
         # Convert string animation names to Animation enum values
         animation_enums = []
         for anim in animations:
-            try:
-                animation_enums.append(Animation(anim))
-            except ValueError:
+            animation_enum = _ANIM_BY_VALUE.get(anim)
+            if animation_enum is None:
                 print(f"Warning: Unknown animation '{anim}', skipping...")
                 continue
+            animation_enums.append(animation_enum)
 
         if not animation_enums:
             print("No valid animations provided!")
@@ -50,37 +60,9 @@ async def main(rigged_model_task_id: str, output_dir: str, animations: list, out
             bake_animation=bake_animation,
             export_with_geometry=export_with_geometry
         )
-
-        # Wait for animation retargeting completion and show progress
-        retarget_result = await client.wait_for_task(retarget_task_id, verbose=True)
-
-        if retarget_result.status == TaskStatus.SUCCESS:
-            print(f"Animation retargeting completed successfully!")
-
-            # Create output directory (if it doesn't exist)
-            os.makedirs(output_dir, exist_ok=True)
-
-            # Download animated model files
-            try:
-                print("Downloading animated model files...")
-                downloaded_files = await client.download_task_models(retarget_result, output_dir)
-
-                # Print downloaded file paths
-                for model_type, file_path in downloaded_files.items():
-                    if file_path:
-                        print(f"Downloaded {model_type}: {file_path}")
-
-            except Exception as e:
-                print(f"Failed to download animated models: {str(e)}")
-        else:
-            print(f"Animation retargeting failed with status: {retarget_result.status}")
-            if retarget_result.error_msg:
-                print(f"Error message: {retarget_result.error_msg}")
-
-
-def get_available_animations():
-    """Get list of available animations for help text."""
-    return [anim.value for anim in Animation]
+        await run_and_download(client, retarget_task_id, output_dir)
+    finally:
+        await close_shared_client()
 
 
 if __name__ == "__main__":
@@ -88,7 +70,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Apply animations to a rigged 3D model using Tripo API")
     parser.add_argument("rigged_model_task_id", help="Task ID of the rigged model")
     parser.add_argument("--animations", nargs="+", required=True,
-                       choices=get_available_animations(),
+                       choices=AVAILABLE_ANIMATIONS,
                        help="Animations to apply (can specify multiple)")
     parser.add_argument("--output-dir", default="./output", help="Directory to save output files")
     parser.add_argument("--format", choices=["glb", "fbx"], default="glb",
@@ -100,6 +82,13 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
+    # Use uvloop's faster event loop when available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Run the main function
     asyncio.run(main(
         args.rigged_model_task_id,
@@ -108,4 +97,4 @@ if __name__ == "__main__":
         args.format,
         not args.no_bake,
         args.with_geometry
-    )) 
\ No newline at end of file
+    ))
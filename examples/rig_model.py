@@ -3,12 +3,14 @@
 Example of using the Tripo API to rig a 3D model for animation.
 """
 
-import os
 import asyncio
 import argparse
 
-from tripo3d import TripoClient
-from tripo3d.models import TaskStatus, RigType, RigSpec
+from tripo3d.models import RigType, RigSpec
+
+# O(1) lookup tables; the enum constructors do a linear scan per call
+_RIG_TYPE_BY_VALUE = {rig.value: rig for rig in RigType}
+_RIG_SPEC_BY_VALUE = {spec.value: spec for spec in RigSpec}
 
 
 async def main(model_task_id: str, output_dir: str, rig_type: str, spec: str, out_format: str):
@@ -22,41 +24,24 @@ async def main(model_task_id: str, output_dir: str, rig_type: str, spec: str, ou
         spec: Rigging specification (mixamo or tripo).
         out_format: Output format (glb or fbx).
     """
-    async with TripoClient() as client:
+    # Import here so `--help` and argument errors never load the HTTP stack
+    from tripo3d import get_shared_client, close_shared_client
+    from tripo3d.cli import run_and_download
+
+    # Reuse the shared client so all requests go over one connection pool
+    client = await get_shared_client()
+    try:
         # Rig the model
         print(f"Rigging model with type: {rig_type}, spec: {spec}, format: {out_format}")
         rig_task_id = await client.rig_model(
             original_model_task_id=model_task_id,
             out_format=out_format,
-            rig_type=RigType(rig_type) if rig_type else None,
-            spec=RigSpec(spec) if spec else None
+            rig_type=_RIG_TYPE_BY_VALUE.get(rig_type),
+            spec=_RIG_SPEC_BY_VALUE.get(spec)
         )
-
-        # Wait for rigging completion and show progress
-        rig_result = await client.wait_for_task(rig_task_id, verbose=True)
-
-        if rig_result.status == TaskStatus.SUCCESS:
-            print(f"Rigging completed successfully!")
-
-            # Create output directory (if it doesn't exist)
-            os.makedirs(output_dir, exist_ok=True)
-
-            # Download rigged model files
-            try:
-                print("Downloading rigged model files...")
-                downloaded_files = await client.download_task_models(rig_result, output_dir)
-
-                # Print downloaded file paths
-                for model_type, file_path in downloaded_files.items():
-                    if file_path:
-                        print(f"Downloaded {model_type}: {file_path}")
-
-            except Exception as e:
-                print(f"Failed to download rigged models: {str(e)}")
-        else:
-            print(f"Rigging failed with status: {rig_result.status}")
-            if rig_result.error_msg:
-                print(f"Error message: {rig_result.error_msg}")
+        await run_and_download(client, rig_task_id, output_dir)
+    finally:
+        await close_shared_client()
 
 
 if __name__ == "__main__":
@@ -73,5 +58,12 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
+    # Use uvloop's faster event loop when available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Run the main function
-    asyncio.run(main(args.model_task_id, args.output_dir, args.rig_type, args.spec, args.format)) 
\ No newline at end of file
+    asyncio.run(main(args.model_task_id, args.output_dir, args.rig_type, args.spec, args.format))
@@ -3,13 +3,9 @@
 Example of using the Tripo API to create a 3D model from text.
 """
 
-import os
 import asyncio
 import argparse
 
-from tripo3d import TripoClient
-from tripo3d.models import TaskStatus
-
 
 async def main(prompt: str, negative_prompt: str = None, output_dir: str = './output'):
     """
@@ -20,36 +16,20 @@ async def main(prompt: str, negative_prompt: str = None, output_dir: str = './ou
         negative_prompt: The negative text prompt.
         output_dir: The directory to save the output files.
     """
-    async with TripoClient() as client:
-        # 创建任务
+    # Import here so `--help` and argument errors never load the HTTP stack
+    from tripo3d import get_shared_client, close_shared_client
+    from tripo3d.cli import run_and_download
+
+    # Reuse the shared client so all requests go over one connection pool
+    client = await get_shared_client()
+    try:
         task_id = await client.text_to_model(
             prompt=prompt,
             negative_prompt=negative_prompt
         )
-
-        # 等待任务完成并显示进度
-        task = await client.wait_for_task(task_id, verbose=True)
-
-        if task.status == TaskStatus.SUCCESS:
-            print(f"\nTask completed successfully!")
-
-            # 创建输出目录（如果不存在）
-            os.makedirs(output_dir, exist_ok=True)
-
-            # 下载模型文件
-            try:
-                print("\nDownloading model files...")
-                downloaded_files = await client.download_task_models(task, output_dir)
-
-                # 打印下载的文件路径
-                for model_type, file_path in downloaded_files.items():
-                    if file_path:
-                        print(f"Downloaded {model_type}: {file_path}")
-
-            except Exception as e:
-                print(f"Failed to download models: {str(e)}")
-        else:
-            print(f"\nTask failed with status: {task.status}")
+        await run_and_download(client, task_id, output_dir)
+    finally:
+        await close_shared_client()
 
 
 if __name__ == "__main__":
@@ -61,5 +41,12 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
+    # Use uvloop's faster event loop when available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Run the main function
-    asyncio.run(main(args.prompt, args.negative_prompt, args.output_dir)) 
\ No newline at end of file
+    asyncio.run(main(args.prompt, args.negative_prompt, args.output_dir))
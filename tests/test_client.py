@@ -8,7 +8,8 @@ import pytest
 import asyncio
 from unittest.mock import patch, MagicMock
 
-from tripo3d import TripoClient, TaskStatus, Task, Balance, TaskOutput
+from tripo3d import TripoClient, TaskStatus, Task, Balance, TaskOutput, get_shared_client, close_shared_client
+from tripo3d.cli import run_and_download
 from tripo3d.exceptions import TripoAPIError, TripoRequestError
 
 
@@ -699,7 +700,7 @@ class TestTripoClient:
 
     @pytest.mark.asyncio
     async def test_polling_backoff_capped(self, client):
-        """Test that polling interval is capped at 30 seconds."""
+        """Test that polling interval grows 1.5x per poll and is capped at 8 seconds."""
         running_task = Task(
             task_id="task-123",
             type="text_to_model",
@@ -733,10 +734,31 @@ class TestTripoClient:
              patch('asyncio.sleep', side_effect=mock_sleep):
             await client.wait_for_task("task-123", polling_interval=1)
 
-        # With initial interval=1, doubling gives: 2, 4, 8, 16, 30, 30, 30, 30, 30, 30
-        # All values should be <= 30
+        # With initial interval=1, 1.5x growth gives:
+        # 1.5, 2.25, 3.375, 5.0625, 7.59375, then capped at 8
+        assert sleep_values[:5] == [1.5, 2.25, 3.375, 5.0625, 7.59375]
+        assert sleep_values[5:] == [8.0] * 5
         for val in sleep_values:
-            assert val <= 30, f"Polling interval {val} exceeds cap of 30s"
+            assert val <= 8.0, f"Polling interval {val} exceeds cap of 8s"
+
+    def test_connection_limits_defaults(self, client):
+        """Test the default connection pool limits."""
+        assert client._impl.connection_limit == 100
+        assert client._impl.per_host_limit == 32
+
+    @pytest.mark.asyncio
+    async def test_connection_limits_plumbed_to_connector(self, api_key):
+        """Test that pool limit kwargs reach the aiohttp connector."""
+        client = TripoClient(api_key=api_key, connection_limit=7, per_host_limit=3)
+        assert client._impl.connection_limit == 7
+        assert client._impl.per_host_limit == 3
+
+        session = await client._impl._ensure_session()
+        try:
+            assert session.connector.limit == 7
+            assert session.connector.limit_per_host == 3
+        finally:
+            await client.close()
 
     @pytest.mark.asyncio
     async def test_upload_file_returns_dict_with_boto3(self, client):
@@ -775,4 +797,74 @@ class TestTripoClient:
             result = await client.upload_file("test.jpg")
 
         assert isinstance(result, dict)
-        assert result == {"file_token": "file-token-123"}
\ No newline at end of file
+        assert result == {"file_token": "file-token-123"}
+
+class TestSharedClient:
+    """Test suite for the module-level shared client."""
+
+    @pytest.mark.asyncio
+    async def test_get_shared_client_returns_same_instance(self):
+        """Test that repeated calls return the same client instance."""
+        client = await get_shared_client(api_key="tsk_test_api_key")
+        try:
+            assert await get_shared_client() is client
+        finally:
+            await close_shared_client()
+
+    @pytest.mark.asyncio
+    async def test_close_shared_client_resets_singleton(self):
+        """Test that a new client is created after the shared one is closed."""
+        client = await get_shared_client(api_key="tsk_test_api_key")
+        await close_shared_client()
+        try:
+            assert await get_shared_client(api_key="tsk_test_api_key") is not client
+        finally:
+            await close_shared_client()
+
+
+class TestRunAndDownload:
+    """Test suite for the shared example runner."""
+
+    @pytest.fixture
+    def client(self):
+        """Fixture for the TripoClient."""
+        return TripoClient(api_key="tsk_test_api_key")
+
+    def _task(self, status):
+        """Build a minimal task with the given status."""
+        return Task(
+            task_id="task-123",
+            type="text_to_model",
+            status=status,
+            input={},
+            output=TaskOutput(model="https://example.com/model.glb"),
+            progress=100,
+            create_time=1625097600
+        )
+
+    @pytest.mark.asyncio
+    async def test_success_downloads_artifacts(self, client, tmp_path):
+        """Test that a successful task is downloaded into the output directory."""
+        output_dir = str(tmp_path / "output")
+        downloaded = {"model": os.path.join(output_dir, "task-123_model.glb")}
+
+        with patch.object(client, 'wait_for_task', return_value=self._task(TaskStatus.SUCCESS)), \
+             patch.object(client, 'download_task_models', return_value=downloaded):
+            result = await run_and_download(client, "task-123", output_dir)
+
+            client.wait_for_task.assert_called_once_with("task-123", verbose=True)
+            client.download_task_models.assert_called_once()
+
+        assert result == downloaded
+        # The output directory is created before downloading
+        assert os.path.isdir(output_dir)
+
+    @pytest.mark.asyncio
+    async def test_failed_task_skips_download(self, client):
+        """Test that a failed task returns None without downloading."""
+        with patch.object(client, 'wait_for_task', return_value=self._task(TaskStatus.FAILED)), \
+             patch.object(client, 'download_task_models') as download:
+            result = await run_and_download(client, "task-123", "./unused")
+
+        assert result is None
+        download.assert_not_called()
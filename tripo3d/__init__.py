@@ -6,10 +6,57 @@ A Python client for the Tripo 3D Generation API.
 
 import os
 import threading
-from .client import TripoClient
+from typing import TYPE_CHECKING, Optional
+
 from .models import Animation, PostStyle, RigType, RigSpec, Task, Balance, TaskStatus, TaskOutput
 from .exceptions import TripoAPIError, TripoRequestError
 
+if TYPE_CHECKING:
+    from .client import TripoClient
+
+
+_shared_client: Optional["TripoClient"] = None
+
+
+async def get_shared_client(api_key: Optional[str] = None) -> "TripoClient":
+    """
+    Get a process-wide shared TripoClient.
+
+    The shared client keeps a single pooled HTTP session alive, so repeated
+    calls (polling, downloads, multiple tasks) reuse connections instead of
+    paying a TCP+TLS handshake per request.
+
+    Args:
+        api_key: The API key for authentication. Only used when the shared
+                 client is first created; ignored afterwards.
+
+    Returns:
+        The shared TripoClient instance.
+    """
+    from .client import TripoClient
+
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = TripoClient(api_key=api_key)
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared client and release its connection pool."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.close()
+        _shared_client = None
+
+
+def __getattr__(name: str):
+    # Import the client lazily so that importing tripo3d (e.g. just for the
+    # enums) doesn't pay for the HTTP stack.
+    if name == "TripoClient":
+        from .client import TripoClient
+        return TripoClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def _detect_location_background():
     """Background thread to detect geographical location."""
@@ -33,6 +80,8 @@ _detection_thread.start()
 __version__ = "0.4.1"
 __all__ = [
     "TripoClient",
+    "get_shared_client",
+    "close_shared_client",
     "Animation",
     "PostStyle",
     "RigType",
@@ -0,0 +1,3 @@
+from ._runner import run_and_download
+
+__all__ = ["run_and_download"]
@@ -0,0 +1,63 @@
+"""
+Shared runner for the example CLIs.
+"""
+
+import os
+import asyncio
+import functools
+from typing import Dict, Optional
+
+from ..client import TripoClient
+from ..models import TaskStatus
+
+
+async def run_and_download(
+    client: TripoClient,
+    task_id: str,
+    output_dir: str,
+) -> Optional[Dict[str, str]]:
+    """
+    Wait for a task to finish, then download its artifacts into output_dir.
+
+    Polls with verbose progress output, creates output_dir off the event
+    loop, and downloads all available artifacts concurrently via
+    ``TripoClient.download_task_models``.
+
+    Args:
+        client: The client that owns the task.
+        task_id: The ID of the task to wait for.
+        output_dir: Directory to save the downloaded files.
+
+    Returns:
+        Mapping of artifact name to downloaded path on success, or None if
+        the task did not succeed or the download failed.
+    """
+    task = await client.wait_for_task(task_id, verbose=True)
+
+    if task.status != TaskStatus.SUCCESS:
+        print(f"Task failed with status: {task.status}")
+        if task.error_msg:
+            print(f"Error message: {task.error_msg}")
+        return None
+
+    print("Task completed successfully!")
+
+    # Create output directory (if it doesn't exist) without blocking the loop
+    # (run_in_executor rather than asyncio.to_thread: 3.8 support)
+    await asyncio.get_event_loop().run_in_executor(
+        None, functools.partial(os.makedirs, output_dir, exist_ok=True)
+    )
+
+    try:
+        print("Downloading model files...")
+        downloaded_files = await client.download_task_models(task, output_dir)
+    except Exception as e:
+        print(f"Failed to download models: {str(e)}")
+        return None
+
+    # Print downloaded file paths
+    for model_type, file_path in downloaded_files.items():
+        if file_path:
+            print(f"Downloaded {model_type}: {file_path}")
+
+    return downloaded_files
@@ -23,13 +23,23 @@ class TripoClient:
     # The base URL for the Tripo API as specified in the OpenAPI schema
     BASE_URL = "https://api.tripo3d.ai/v2/openapi"
 
-    def __init__(self, api_key: Optional[str] = None, IS_GLOBAL: bool = True):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        IS_GLOBAL: bool = True,
+        connection_limit: int = 100,
+        per_host_limit: int = 32,
+    ):
         """
         Initialize the Tripo API client.
 
         Args:
             api_key: The API key for authentication. If not provided, it will be read from the
                      TRIPO_API_KEY environment variable.
+            connection_limit: Total size of the HTTP connection pool. The pool is the hard
+                              ceiling on concurrent transfers, so raise it for bulk downloads.
+            per_host_limit: Maximum concurrent connections per host (the API and the model
+                            CDN are separate hosts).
 
         Raises:
             ValueError: If no API key is provided and the TRIPO_API_KEY environment variable is not set.
@@ -46,12 +56,23 @@ class TripoClient:
         if not IS_GLOBAL:
             self.BASE_URL = "https://api.tripo3d.com/v2/openapi"
 
-        self._impl = ClientImpl(self.api_key, self.BASE_URL)
+        self._connection_limit = connection_limit
+        self._per_host_limit = per_host_limit
+        self._impl = ClientImpl(
+            self.api_key,
+            self.BASE_URL,
+            connection_limit=connection_limit,
+            per_host_limit=per_host_limit,
+        )
+        self._ssl_disabled_impl = None
 
 
     async def close(self) -> None:
         """Close any open connections."""
         await self._impl.close()
+        if self._ssl_disabled_impl is not None:
+            await self._ssl_disabled_impl.close()
+            self._ssl_disabled_impl = None
 
     def _is_ssl_error(self, error: Exception) -> bool:
         """Check if the error is an SSL certificate verification error."""
@@ -65,6 +86,25 @@ class TripoClient:
         ]
         return any(indicator in error_str for indicator in ssl_error_indicators)
 
+    def _get_ssl_disabled_impl(self):
+        """
+        Get the SSL-verification-disabled fallback implementation.
+
+        Cached on the client so repeated fallback downloads share one pooled
+        session instead of constructing (and handshaking) a new one per file.
+        It is closed together with the client in close().
+        """
+        if self._ssl_disabled_impl is None:
+            from .client_impl import ClientImpl
+            self._ssl_disabled_impl = ClientImpl(
+                self.api_key,
+                self.BASE_URL,
+                verify_ssl=False,
+                connection_limit=self._connection_limit,
+                per_host_limit=self._per_host_limit,
+            )
+        return self._ssl_disabled_impl
+
     async def _download_with_ssl_retry(self, url: str, output_path: str) -> None:
         """Download file with automatic SSL error retry."""
         try:
@@ -78,13 +118,7 @@ class TripoClient:
                     "Consider updating your system's certificate store for better security.",
                     UserWarning
                 )
-                # Create a new implementation with SSL disabled just for this download
-                from .client_impl import ClientImpl
-                ssl_disabled_impl = ClientImpl(self.api_key, self.BASE_URL, verify_ssl=False)
-                try:
-                    await ssl_disabled_impl.download_file(url, output_path)
-                finally:
-                    await ssl_disabled_impl.close()
+                await self._get_ssl_disabled_impl().download_file(url, output_path)
             else:
                 raise
 
@@ -148,16 +182,20 @@ class TripoClient:
     async def wait_for_task(
         self,
         task_id: str,
-        polling_interval: float = 2.0,
+        polling_interval: float = 0.5,
         timeout: Optional[float] = None,
         verbose: bool = False
     ) -> Task:
         """
         Wait for a task to complete.
 
+        Polling starts at ``polling_interval`` and backs off exponentially up
+        to a ceiling of 8 seconds, so short tasks are picked up quickly while
+        long tasks don't waste round-trips.
+
         Args:
             task_id: The ID of the task to wait for.
-            polling_interval: The interval in seconds to poll the task status.
+            polling_interval: The initial interval in seconds to poll the task status.
             timeout: The maximum time in seconds to wait for the task to complete.
                     If None, wait indefinitely.
 
@@ -195,10 +233,10 @@ class TripoClient:
 
             # Calculate next polling interval based on estimated time remaining
             if hasattr(task, 'running_left_time') and task.running_left_time is not None:
-                # Use 80% of the estimated remaining time as the next polling interval
+                # Use half of the estimated remaining time as the next polling interval
                 polling_interval = max(2, task.running_left_time * 0.5)
             else:
-                polling_interval = min(polling_interval * 2, 30)
+                polling_interval = min(polling_interval * 1.5, 8.0)
             # Wait before polling again
             await asyncio.sleep(polling_interval)
 
@@ -211,6 +249,10 @@ class TripoClient:
         """
         Download model files from a completed task.
 
+        All available artifacts are downloaded concurrently with
+        ``asyncio.gather``, bounded to 8 parallel transfers so the overlapped
+        round-trips are amortized without pegging CPU or disk.
+
         Args:
             task: The completed task object.
             output_dir: Directory to save the downloaded files.
@@ -245,11 +287,16 @@ class TripoClient:
                 return ext
             return '.jpg' if field_name in _IMAGE_FIELDS else '.glb'
 
+        # Bound parallelism so a task with many artifacts doesn't saturate
+        # the connection pool or local disk.
+        semaphore = asyncio.Semaphore(8)
+
         async def download_file(url: str, filename: str) -> Optional[str]:
             if not url:
                 return None
             output_path = os.path.join(output_dir, filename)
-            await self._download_with_ssl_retry(url, output_path)
+            async with semaphore:
+                await self._download_with_ssl_retry(url, output_path)
             return output_path
 
         download_tasks = []
@@ -1,15 +1,25 @@
 import os
 import ssl
+import queue
+import asyncio
+import threading
 import aiohttp
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
 from ..exceptions import TripoAPIError, TripoRequestError
 from .base_client import BaseClientImpl
 
 class AioHttpClientImpl(BaseClientImpl):
     """Implementation using aiohttp library."""
 
-    def __init__(self, api_key: str, base_url: str, verify_ssl: bool = True):
-        super().__init__(api_key, base_url, verify_ssl)
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        verify_ssl: bool = True,
+        connection_limit: int = 100,
+        per_host_limit: int = 32,
+    ):
+        super().__init__(api_key, base_url, verify_ssl, connection_limit, per_host_limit)
         self._session: Optional[aiohttp.ClientSession] = None
         self._ssl_context = self._create_ssl_context(verify_ssl)
 
@@ -26,8 +36,15 @@ class AioHttpClientImpl(BaseClientImpl):
     async def _ensure_session(self) -> aiohttp.ClientSession:
         """Ensure that an aiohttp session exists."""
         if self._session is None or self._session.closed:
-            # Create connector with SSL context
-            connector = aiohttp.TCPConnector(ssl=self._ssl_context)
+            # Create connector with SSL context. Keepalive and DNS caching let
+            # the polling and download requests reuse warm connections.
+            connector = aiohttp.TCPConnector(
+                ssl=self._ssl_context,
+                limit=self.connection_limit,
+                limit_per_host=self.per_host_limit,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+            )
             self._session = aiohttp.ClientSession(
                 headers={"Authorization": f"Bearer {self.api_key}"},
                 connector=connector
@@ -130,6 +147,33 @@ class AioHttpClientImpl(BaseClientImpl):
         except IOError as e:
             raise TripoRequestError(status_code=0, message=f"File error: {str(e)}")
 
+    @staticmethod
+    def _write_from_queue(
+        output_path: str,
+        chunks: "queue.Queue",
+        on_chunk_consumed: Callable[[], None],
+    ) -> None:
+        """Write queued chunks to disk; open+write+close happen in one thread.
+
+        ``on_chunk_consumed`` is invoked after every dequeue so a producer
+        waiting on the bounded queue can be woken.
+        """
+        try:
+            with open(output_path, 'wb') as f:
+                while True:
+                    chunk = chunks.get()
+                    on_chunk_consumed()
+                    if chunk is None:
+                        return
+                    f.write(chunk)
+        except Exception:
+            # Keep draining so a waiting producer can never deadlock against
+            # a dead writer; the error is re-raised to the awaiter.
+            while chunks.get() is not None:
+                on_chunk_consumed()
+            on_chunk_consumed()
+            raise
+
     async def download_file(self, url: str, output_path: str) -> None:
         """Download a file using aiohttp."""
         session = await self._ensure_session()
@@ -142,11 +186,64 @@ class AioHttpClientImpl(BaseClientImpl):
                         message=f"Failed to download: {response.reason}"
                     )
 
-                with open(output_path, 'wb') as f:
+                # Stream chunks to a dedicated writer thread so file I/O never
+                # blocks the event loop. The bounded queue applies backpressure
+                # when the disk falls behind the network, capping memory at
+                # maxsize chunks. The writer deliberately does NOT use the
+                # default executor: concurrent downloads would park one
+                # long-lived writer per file there and starve everything else
+                # dispatched to the pool. The producer stays on-loop with
+                # put_nowait plus a not-full event signalled from the writer
+                # thread, so no step ever waits for a free executor slot.
+                loop = asyncio.get_event_loop()
+                chunks: "queue.Queue" = queue.Queue(maxsize=16)
+                not_full = asyncio.Event()
+                writer_done = loop.create_future()
+
+                def on_chunk_consumed() -> None:
+                    loop.call_soon_threadsafe(not_full.set)
+
+                def finish(error: Optional[BaseException]) -> None:
+                    if not writer_done.done():
+                        if error is not None:
+                            writer_done.set_exception(error)
+                        else:
+                            writer_done.set_result(None)
+
+                def writer_main() -> None:
+                    try:
+                        self._write_from_queue(output_path, chunks, on_chunk_consumed)
+                    except BaseException as e:
+                        loop.call_soon_threadsafe(finish, e)
+                    else:
+                        loop.call_soon_threadsafe(finish, None)
+
+                async def put_chunk(item: Optional[bytes]) -> None:
+                    while True:
+                        try:
+                            chunks.put_nowait(item)
+                            return
+                        except queue.Full:
+                            not_full.clear()
+                            # Re-check after clearing: the writer may have
+                            # drained (and signalled) between the failed put
+                            # and the clear.
+                            try:
+                                chunks.put_nowait(item)
+                                return
+                            except queue.Full:
+                                await not_full.wait()
+
+                writer = threading.Thread(target=writer_main, daemon=True)
+                writer.start()
+                try:
                     chunk_size = 1024 * 1024  # 1MB chunks
                     async for chunk in response.content.iter_chunked(chunk_size):
                         if chunk:
-                            f.write(chunk)
+                            await put_chunk(chunk)
+                finally:
+                    await put_chunk(None)
+                    await writer_done
         except aiohttp.ClientError as e:
             raise TripoRequestError(
                 status_code=0,
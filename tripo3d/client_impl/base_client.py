@@ -4,10 +4,19 @@ from typing import Dict, Any, Optional
 class BaseClientImpl:
     """Base implementation for Tripo API client."""
 
-    def __init__(self, api_key: str, base_url: str, verify_ssl: bool = True):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        verify_ssl: bool = True,
+        connection_limit: int = 100,
+        per_host_limit: int = 32,
+    ):
         self.api_key = api_key
         self.base_url = base_url
         self.verify_ssl = verify_ssl
+        self.connection_limit = connection_limit
+        self.per_host_limit = per_host_limit
 
     def _url(self, path: str) -> str:
         """Construct a full URL from a path."""
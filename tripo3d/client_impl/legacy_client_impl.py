@@ -66,8 +66,17 @@ class HttpResponse:
 class LegacyClientImpl(BaseClientImpl):
     """Implementation using raw sockets."""
 
-    def __init__(self, api_key: str, base_url: str, verify_ssl: bool = True):
-        super().__init__(api_key, base_url, verify_ssl)
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        verify_ssl: bool = True,
+        connection_limit: int = 100,
+        per_host_limit: int = 32,
+    ):
+        # The pool limits are accepted for interface parity but unused: the
+        # raw-socket implementation keeps a single connection.
+        super().__init__(api_key, base_url, verify_ssl, connection_limit, per_host_limit)
         self._ssl_context = self._create_ssl_context(verify_ssl)
         self._reader: Optional[asyncio.StreamReader] = None
         self._writer: Optional[asyncio.StreamWriter] = None
@@ -263,8 +272,13 @@ class LegacyClientImpl(BaseClientImpl):
                     message=f"Failed to download: HTTP {response.status}"
                 )
 
-            with open(output_path, 'wb') as f:
-                f.write(response.body)
+            def _sync_write() -> None:
+                with open(output_path, 'wb') as f:
+                    f.write(response.body)
+
+            # One thread dispatch covers open+write+close
+            # (run_in_executor rather than asyncio.to_thread: 3.8 support)
+            await asyncio.get_event_loop().run_in_executor(None, _sync_write)
 
         finally:
             writer.close()